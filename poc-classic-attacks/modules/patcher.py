@@ -11,7 +11,6 @@ of the user circuits.
 import psutil
 import os
 import time
-import copy
 import shutil
 
 
@@ -144,8 +143,7 @@ class PythonPackagePatcher:
         -------
         None
         """
-        data = copy.deepcopy(self._m_data)
-        for d in data:
+        for d in list(self._m_data):
             self._remove_patch(d)
 
     def _add_patch(self, path):